@@ -14,7 +14,8 @@ NC='\033[0m' # No Color
 
 # Função: Gerar ID único de task
 generate_task_id() {
-    echo "TASK-$(date +%s | tail -c 4)"
+    local epoch=$(date +%s)
+    echo "TASK-${epoch: -3}"
 }
 
 # Função: Obter timestamp ISO 8601
@@ -32,8 +33,7 @@ create_task() {
     local task_id=$(generate_task_id)
     local now=$(get_timestamp)
     
-    cat "$SPRINT_FILE" | \
-        jq --arg id "$task_id" \
+    jq --arg id "$task_id" \
            --arg title "$title" \
            --arg agent "$agent" \
            --arg priority "$priority" \
@@ -56,7 +56,7 @@ create_task() {
            }] | 
            .metrics.tasks.total += 1 | 
            .metrics.tasks.todo += 1 | 
-           .metrics.total_points += $points' \
+           .metrics.total_points += $points' "$SPRINT_FILE" \
         > "$SPRINT_FILE.tmp" && mv "$SPRINT_FILE.tmp" "$SPRINT_FILE"
     
     echo "{\"timestamp\":\"$now\",\"action\":\"task_created\",\"task_id\":\"$task_id\",\"agent\":\"$agent\",\"title\":\"$title\",\"story_points\":$points}" >> "$LOG_FILE"
@@ -72,17 +72,15 @@ update_status() {
     local notes="${3:-}"
     local now=$(get_timestamp)
     
-    # Obter status atual
-    local old_status=$(cat "$SPRINT_FILE" | jq -r ".tasks[] | select(.id==\"$task_id\") | .status")
+    # Obter status atual e pontos (para atualizar métricas) em uma única leitura
+    local old_status points
+    read -r old_status points < <(jq -r ".tasks[] | select(.id==\"$task_id\") | \"\(.status) \(.story_points)\"" "$SPRINT_FILE")
     
     if [ -z "$old_status" ]; then
         echo -e "${RED}❌ Task $task_id não encontrada${NC}"
         return 1
     fi
     
-    # Obter pontos para atualizar métricas
-    local points=$(cat "$SPRINT_FILE" | jq -r ".tasks[] | select(.id==\"$task_id\") | .story_points")
-    
     # Atualizar JSON
     local update_expr='(.tasks[] | select(.id=="'$task_id'")) |= . + {"status": "'$new_status'"'
     
@@ -115,7 +113,7 @@ update_status() {
         esac
     fi
     
-    cat "$SPRINT_FILE" | jq "$update_expr" > "$SPRINT_FILE.tmp" && mv "$SPRINT_FILE.tmp" "$SPRINT_FILE"
+    jq "$update_expr" "$SPRINT_FILE" > "$SPRINT_FILE.tmp" && mv "$SPRINT_FILE.tmp" "$SPRINT_FILE"
     
     # Logar
     local action="task_updated"
@@ -133,7 +131,7 @@ sprint_status() {
     echo -e "${BLUE}📊 Status do Sprint${NC}"
     echo ""
     
-    cat "$SPRINT_FILE" | jq -r '
+    jq -r '
         "Sprint: \(.sprint)",
         "Período: \(.start_date) a \(.end_date)",
         "Objetivo: \(.goal)",
@@ -147,7 +145,7 @@ sprint_status() {
         "  🔄 Em Progresso: \(.metrics.tasks.in_progress)",
         "  📋 A Fazer: \(.metrics.tasks.todo)",
         "  🚫 Bloqueadas: \(.metrics.tasks.blocked)"
-    '
+    ' "$SPRINT_FILE"
 }
 
 # Função: Listar tasks
@@ -158,9 +156,9 @@ list_tasks() {
     echo ""
     
     if [ "$status" = "all" ]; then
-        cat "$SPRINT_FILE" | jq -r '.tasks[] | "\(.id) | \(.status) | \(.agent) | \(.title) (\(.story_points) SP)"'
+        jq -r '.tasks[] | "\(.id) | \(.status) | \(.agent) | \(.title) (\(.story_points) SP)"' "$SPRINT_FILE"
     else
-        cat "$SPRINT_FILE" | jq -r ".tasks[] | select(.status==\"$status\") | \"\(.id) | \(.agent) | \(.title) (\(.story_points) SP)\""
+        jq -r ".tasks[] | select(.status==\"$status\") | \"\(.id) | \(.agent) | \(.title) (\(.story_points) SP)\"" "$SPRINT_FILE"
     fi
 }
 
@@ -168,7 +166,7 @@ list_tasks() {
 task_details() {
     local task_id="$1"
     
-    cat "$SPRINT_FILE" | jq ".tasks[] | select(.id==\"$task_id\")"
+    jq ".tasks[] | select(.id==\"$task_id\")" "$SPRINT_FILE"
 }
 
 # Função: Ver tasks de um agente
@@ -178,32 +176,26 @@ agent_tasks() {
     echo -e "${BLUE}📋 Tasks de: $agent${NC}"
     echo ""
     
-    cat "$SPRINT_FILE" | jq -r ".tasks[] | select(.agent==\"$agent\") | \"\(.id) | \(.status) | \(.title) (\(.story_points) SP)\""
+    jq -r ".tasks[] | select(.agent==\"$agent\") | \"\(.id) | \(.status) | \(.title) (\(.story_points) SP)\"" "$SPRINT_FILE"
 }
 
 # Função: Validar consistência
 validate() {
     echo -e "${YELLOW}🔍 Validando consistência...${NC}"
     
-    # Validar JSON
-    if ! jq empty "$SPRINT_FILE" 2>/dev/null; then
+    # Validar JSON e comparar total calculado vs armazenado em uma única leitura
+    local calc_total stored_total
+    read -r calc_total stored_total < <(jq -r '"\(.tasks | length) \(.metrics.tasks.total)"' "$SPRINT_FILE" 2>/dev/null)
+    
+    if [ -z "$calc_total" ]; then
         echo -e "${RED}❌ JSON inválido em $SPRINT_FILE${NC}"
         return 1
     fi
     
-    # Recalcular métricas
-    local calc_total=$(cat "$SPRINT_FILE" | jq '.tasks | length')
-    local calc_todo=$(cat "$SPRINT_FILE" | jq '.tasks | map(select(.status=="TODO")) | length')
-    local calc_progress=$(cat "$SPRINT_FILE" | jq '.tasks | map(select(.status=="IN_PROGRESS")) | length')
-    local calc_done=$(cat "$SPRINT_FILE" | jq '.tasks | map(select(.status=="DONE")) | length')
-    local calc_blocked=$(cat "$SPRINT_FILE" | jq '.tasks | map(select(.status=="BLOCKED")) | length')
-    
-    local stored_total=$(cat "$SPRINT_FILE" | jq '.metrics.tasks.total')
-    
     if [ "$calc_total" != "$stored_total" ]; then
         echo -e "${RED}❌ Métricas inconsistentes! Recalculando...${NC}"
         
-        cat "$SPRINT_FILE" | jq '
+        jq '
             .metrics.tasks.total = (.tasks | length) |
             .metrics.tasks.todo = (.tasks | map(select(.status=="TODO")) | length) |
             .metrics.tasks.in_progress = (.tasks | map(select(.status=="IN_PROGRESS")) | length) |
@@ -211,7 +203,7 @@ validate() {
             .metrics.tasks.blocked = (.tasks | map(select(.status=="BLOCKED")) | length) |
             .metrics.total_points = ([.tasks[].story_points] | add) |
             .metrics.completed_points = ([.tasks[] | select(.status=="DONE") | .story_points] | add)
-        ' > "$SPRINT_FILE.tmp" && mv "$SPRINT_FILE.tmp" "$SPRINT_FILE"
+        ' "$SPRINT_FILE" > "$SPRINT_FILE.tmp" && mv "$SPRINT_FILE.tmp" "$SPRINT_FILE"
         
         echo -e "${GREEN}✅ Métricas corrigidas${NC}"
     else
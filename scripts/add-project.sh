@@ -94,6 +94,9 @@ if [ -z "$PROJECT_REPO" ]; then
     echo ""
     echo -e "${BLUE}Creating initial project files...${NC}"
 
+    # Resolve the date once so every generated file agrees on "today"
+    TODAY=$(date +%Y-%m-%d)
+
     # Create project.json
     cat > "$PROJECT_DIR/project.json" <<EOF
 {
@@ -111,8 +114,8 @@ EOF
   "current_sprint": {
     "number": 1,
     "objective": "Initial setup",
-    "start_date": "$(date +%Y-%m-%d)",
-    "end_date": "$(date -d '+14 days' +%Y-%m-%d)",
+    "start_date": "$TODAY",
+    "end_date": "$(date -d "$TODAY +14 days" +%Y-%m-%d)",
     "tasks": []
   }
 }
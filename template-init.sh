@@ -46,6 +46,9 @@ fi
 echo ""
 echo -e "${GREEN}[1/6] Setting up project directories...${NC}"
 
+# Resolve the date once so every generated file agrees on "today"
+TODAY=$(date +%Y-%m-%d)
+
 # Create new project directory structure
 mkdir -p "project-state/projects/$PROJECT_NAME"
 
@@ -53,8 +56,8 @@ mkdir -p "project-state/projects/$PROJECT_NAME"
 cat > "project-state/projects/$PROJECT_NAME/current-sprint.json" <<EOF
 {
   "sprint": 1,
-  "start_date": "$(date +%Y-%m-%d)",
-  "end_date": "$(date -d '+14 days' +%Y-%m-%d)",
+  "start_date": "$TODAY",
+  "end_date": "$(date -d "$TODAY +14 days" +%Y-%m-%d)",
   "goal": "Initial project setup and planning",
   "epic": "EPIC-001",
   "metrics": {
@@ -76,7 +79,7 @@ cat > "project-state/projects/$PROJECT_NAME/project.json" <<EOF
 {
   "project_name": "$PROJECT_DISPLAY_NAME",
   "description": "$PROJECT_DESCRIPTION",
-  "start_date": "$(date +%Y-%m-%d)",
+  "start_date": "$TODAY",
   "tech_stack": {
     "frontend": "Vue 3 + TypeScript + Tailwind CSS",
     "backend": "FastAPI + Python",
@@ -97,14 +100,14 @@ cat > "project-state/projects/$PROJECT_NAME/project.json" <<EOF
       "title": "Initial Setup",
       "status": "IN_PROGRESS",
       "priority": "P0",
-      "start_date": "$(date +%Y-%m-%d)",
-      "target_date": "$(date -d '+30 days' +%Y-%m-%d)",
+      "start_date": "$TODAY",
+      "target_date": "$(date -d "$TODAY +30 days" +%Y-%m-%d)",
       "description": "Set up project infrastructure and development environment",
       "sprints": [1]
     }
   ],
   "okrs": {
-    "Q1_$(date +%Y)": {
+    "Q1_${TODAY:0:4}": {
       "objective": "Launch MVP",
       "key_results": [
         "Complete core functionality",